@@ -1,20 +1,51 @@
 # %%
 from __future__ import annotations
 
+import functools
 import re
 import tokenize
+from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Optional, cast
+from typing import Any, Callable, Optional, Sequence, cast
 
 import numpy as np
-import pandas as pd
 import pint
 from numpy.dtypes import StringDType
 from toolz.curried import map
 
 from davislib.dimensions import Dimensions
 
-from .scale import Scale
+from .scale import Scale, _min_int_dtype
+
+
+# %%
+_UREG = pint.application_registry.get()
+_DIMENSIONLESS = str(_UREG.dimensionless)
+_NUMBER_RE = re.compile(tokenize.Number)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_quantity(value: str) -> tuple[Any, str]:
+    # parsing with pint is expensive and values rarely change between buffers
+    quantity = _UREG.Quantity(value)  # type: ignore
+    quantity = cast(pint.Quantity, quantity)
+    return quantity.magnitude, str(quantity.units)
+
+
+# decoders for string attributes, indexed by the result of `Attribute._classify`
+_IDENTITY, _INT, _FLOAT, _QUANTITY = range(4)
+_DECODERS: tuple[Callable[[str], Any], ...] = (
+    lambda x: x,
+    lambda x: int(x),
+    lambda x: float(x),
+    lambda x: _parse_quantity(x)[0],
+)
+
+
+def _string_cast(dtype: np.dtype) -> Callable[[Sequence[str]], np.ndarray]:
+    # batch decoder for int and float attributes: numpy parses all strings
+    # in a single cast (with the same overflow checks as `int`/`float`)
+    return lambda values: np.asarray(values, dtype=StringDType()).astype(dtype)
 
 
 # %%
@@ -31,6 +62,7 @@ class Attribute:
         dims: Dimensions,
         *,
         decoder: Callable[[str], Any] = lambda s: s,
+        batch_decoder: Optional[Callable[[Sequence[Any]], np.ndarray]] = None,
         shape: tuple[int, ...] = (),
         unit: Optional[str] = None,
         dtype: np.dtype = StringDType(),
@@ -44,6 +76,7 @@ class Attribute:
 
         self._shape = shape
         self._decoder = decoder
+        self._batch_decoder = batch_decoder
         self._dtype = dtype
         self._raw_value = raw_value
         self._scale = scale
@@ -96,6 +129,20 @@ class Attribute:
         else:
             return _value
 
+    def decode_batch(self, values: Sequence[Any]) -> np.ndarray:
+        # decodes the raw values of several buffers/frames into one array
+        # (stacked along a new first axis) and scales them in a single pass
+        if self._batch_decoder is not None:
+            _values = self._batch_decoder(values)
+        else:
+            _values = np.asarray(
+                [self._decoder(value) for value in values], self._dtype
+            )
+        if self._scale is not None:
+            return self._scale.scale_data(_values)
+        else:
+            return _values
+
     def to_dict(self):
         return dict(
             key=self._key,
@@ -135,16 +182,91 @@ class Attribute:
 
     @staticmethod
     def _decode_timestamp(value: str):
+        # fast path for the fixed layout written by DaVis, e.g.
+        # '2025-02-12T11:55:25,594+01:00': the first 19 characters hold date
+        # and time, followed by optional fractional seconds and the time zone
+        # (which is dropped, keeping the local time)
+        fraction = value[19:].split('+')[0].split('-')[0].rstrip('Z')
+        try:
+            return np.datetime64(value[:19] + fraction.replace(',', '.'), 'us')
+        except ValueError:
+            return Attribute._parse_timestamp(value)
+
+    @staticmethod
+    def _decode_timestamps(values: Sequence[str]) -> np.ndarray:
+        # vectorized version of `_decode_timestamp`: the strings are viewed
+        # as a matrix of characters, so that the time zone is cut off and the
+        # decimal comma is replaced for all values at once, before numpy
+        # parses them in a single cast
+        chars = np.array(values, dtype=str)
+        width = chars.dtype.itemsize // 4
+        if chars.ndim != 1 or width <= 19:
+            return np.array(
+                [Attribute._decode_timestamp(value) for value in values],
+                dtype='datetime64[us]',
+            )
+        chars = chars.view('U1').reshape(len(chars), width)
+        tail = chars[:, 19:]
+        tail[np.logical_or.accumulate(np.isin(tail, ('+', '-', 'Z')), axis=1)] = ''
+        tail[tail == ','] = '.'
+        try:
+            return chars.view(f'U{width}')[:, 0].astype('datetime64[us]')
+        except ValueError:
+            return np.array(
+                [Attribute._decode_timestamp(value) for value in values],
+                dtype='datetime64[us]',
+            )
+
+    @staticmethod
+    def _parse_timestamp(value: str):
+        # slow fallback for layouts numpy cannot parse (e.g. unpadded fields),
+        # the DaVis layout never takes this path
         if ',' in value:
             format = r'%Y-%m-%dT%H:%M:%S,%f%z'
         elif '.' in value:
             format = r'%Y-%m-%dT%H:%M:%S.%f%z'
         else:
             format = r'%Y-%m-%dT%H:%M:%S%z'
-        return pd.to_datetime(
-            value,
-            format=format,
-        ).tz_localize(None)
+        # drop the time zone, but keep the local time (as recorded by DaVis)
+        timestamp = datetime.strptime(value, format).replace(tzinfo=None)
+        return np.datetime64(timestamp, 'us')
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _classify(value: str) -> tuple[np.dtype, int, Optional[str]]:
+        # DaVis repeats the same string values for every buffer and frame,
+        # hence the classification is cached by value. Only the index of the
+        # decoder is returned, so that no closures are kept in the cache.
+        first = value[:1]
+        if first.isalpha() and first not in 'iInN':
+            # plain text (only 'inf' and 'nan' start with a letter and still
+            # convert to a number), skip the failing conversions below
+            return StringDType(), _IDENTITY, None
+        elif (_value := Attribute._try_int(value)) is not None:
+            # try to convert value to int
+            return _min_int_dtype(_value), _INT, _DIMENSIONLESS
+        elif (_value := Attribute._try_float(value)) is not None:
+            # try to convert value to float
+            return np.dtype(type(_value)), _FLOAT, _DIMENSIONLESS
+        elif (
+            (value[:1].isdigit() or value[:1] == '.')
+            and _NUMBER_RE.match(value)
+            and value.count('.') <= 1
+        ):
+            # check if value starts with a number and does not contain more
+            # than one '.' character
+            # (the latter is to avoid matching version strings)
+            try:
+                # try to convert value to pint.Quantity
+                magnitude, units = _parse_quantity(value)
+                if isinstance(magnitude, int):
+                    dtype = _min_int_dtype(magnitude)
+                else:
+                    dtype = np.min_scalar_type(magnitude)
+                return dtype, _QUANTITY, units
+            except (pint.PintError, AssertionError):
+                pass
+        return StringDType(), _IDENTITY, None
 
     @staticmethod
     def infer(
@@ -160,6 +282,7 @@ class Attribute:
         shape = ()
         dtype = np.dtype(object)
         decoder = lambda x: x
+        batch_decoder = None
 
         if isinstance(value, np.ndarray):
             _value = np.squeeze(value)
@@ -167,42 +290,20 @@ class Attribute:
             dtype = _value.dtype
             decoder = lambda x: np.squeeze(x)
             if unit is None:
-                unit = str(pint.Unit(''))
+                unit = _DIMENSIONLESS
         elif key.lower() == 'timestamp':
             dtype = np.dtype('datetime64[us]')
             decoder = Attribute._decode_timestamp
+            batch_decoder = Attribute._decode_timestamps
         elif isinstance(value, str):
-            if (_value := Attribute._try_int(value)) is not None:
-                # try to convert value to int
-                dtype = np.min_scalar_type(_value)
-                decoder = lambda x: int(x)
-                if unit is None:
-                    unit = str(pint.Unit(''))
-            elif (_value := Attribute._try_float(value)) is not None:
-                # try to convert value to float
-                dtype = np.dtype(type(_value))
-                decoder = lambda x: float(x)
-                if unit is None:
-                    unit = str(pint.Unit(''))
-            elif re.match(rf'{tokenize.Number}', value) and value.count('.') <= 1:
-                # check if value starts with a number and does not contain more
-                # than one '.' character
-                # (the latter is to avoid matching version strings)
-                try:
-                    # try to convert value to pint.Quantity
-                    ureg = pint.application_registry.get()
-                    quantity = ureg.Quantity(value)  # type: ignore
-                    quantity = cast(pint.Quantity, quantity)
-
-                    unit = str(quantity.units)
-                    dtype = np.min_scalar_type(quantity.magnitude)
-                    decoder = lambda x: (
-                        pint.application_registry.get().Quantity(x).magnitude
-                    )
-                except (pint.PintError, AssertionError):
-                    dtype = StringDType()
-            else:
-                dtype = StringDType()
+            dtype, decoder_id, inferred_unit = Attribute._classify(value)
+            decoder = _DECODERS[decoder_id]
+            if decoder_id in (_INT, _FLOAT) and dtype.kind in 'iuf':
+                # integers wider than 64 bits are kept as python ints (object
+                # dtype), which a string cast cannot produce
+                batch_decoder = _string_cast(dtype)
+            if decoder_id == _QUANTITY or unit is None:
+                unit = inferred_unit
 
         # return attribute value as is
         return Attribute(
@@ -210,6 +311,7 @@ class Attribute:
             level,
             dims.with_dimensions(**{f'dim_{i}': size for i, size in enumerate(shape)}),
             decoder=decoder,
+            batch_decoder=batch_decoder,
             dtype=dtype,
             shape=shape,
             unit=unit,
@@ -1,9 +1,27 @@
+import functools
+
 import numpy as np
 
 from .dimensions import Dimensions
 from .scale import Scale
 
 
+def _copy_planes(planes, iz, iy, ix, out: np.ndarray):
+    # planes are ndarrays already (lvpyio exposes them without copies), hence
+    # they are copied straight into `out`; a single plane (the common case)
+    # is copied without building the temporary list for `np.stack`
+    if len(iz) == 1:
+        np.copyto(out[0], planes[iz[0]][iy, ix], casting='same_kind')
+    else:
+        np.stack([planes[k][iy, ix] for k in iz], out=out)
+
+
+def _copy_and_scale(planes, iz, iy, ix, out: np.ndarray, slope, offset):
+    _copy_planes(planes, iz, iy, ix, out)
+    np.multiply(out, slope, out=out, dtype=out.dtype)
+    np.add(out, offset, out=out, dtype=out.dtype)
+
+
 class Component:
     def __init__(self, name: str, dims: Dimensions, dtype: np.dtype, scale: Scale):
         self.name = name
@@ -16,5 +34,24 @@ class Component:
     def shape(self):
         return self.dimensions.shape
 
-    def scale_data(self, data):
-        return self.scale.scale_data(data)
+    def scale_data(self, data, out=None):
+        return self.scale.scale_data(data, out=out)
+
+    def read_planes(self, planes, iz, iy, ix, out: np.ndarray):
+        # copies (and scales) the planes `iz` of a single frame into `out`
+        self._reader(planes, iz, iy, ix, out)
+        return out
+
+    @functools.cached_property
+    def _reader(self):
+        # shape, dtype and scale of a component are fixed, hence the reader
+        # is specialized once: identity scales skip the scaling pass and
+        # other scales have slope and offset bound as python scalars (with a
+        # partial of a module level function, so components stay picklable)
+        if self.scale.is_identity:
+            return _copy_planes
+        return functools.partial(
+            _copy_and_scale,
+            slope=self.scale._slope_scalar,
+            offset=self.scale._offset_scalar,
+        )
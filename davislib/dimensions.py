@@ -1,33 +1,101 @@
-from typing import List, Mapping
+from __future__ import annotations
+
+import sys
+import weakref
+from typing import Any, List, Mapping
+
+
+# shared instances of `Dimensions` by class, squeeze and levels
+_INSTANCES: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+# number of index keys kept per instance of `Dimensions`
+_INDEX_CACHE_SIZE = 512
 
 
 class Dimensions(Mapping[str, int]):
-    def __init__(self, squeeze: bool = True, **kwargs: int):
-        self._levels = kwargs.copy()
+    # dimensions are created for every attribute and component, hence they
+    # are kept small: all levels and the active dimensions are stored as
+    # parallel tuples of names and sizes
+    __slots__ = (
+        '_all_names',
+        '_all_sizes',
+        '_squeeze',
+        '_names',
+        '_shape',
+        '_index',
+        '_index_cache',
+        '__weakref__',
+    )
+
+    def __new__(cls, squeeze: bool = True, **kwargs: int):
+        # dimensions are immutable, so instances with identical levels are
+        # shared instead of rebuilt for every attribute and component
+        key = (cls, squeeze, tuple(kwargs.items()))
+        self = _INSTANCES.get(key)
+        if self is None:
+            self = super().__new__(cls)
+            self._initialize(squeeze, kwargs)
+            _INSTANCES[key] = self
+        return self
+
+    def __reduce__(self):
+        # restore through `__new__`, so that unpickled dimensions are shared
+        return _make_dimensions, (
+            type(self),
+            self._squeeze,
+            tuple(zip(self._all_names, self._all_sizes)),
+        )
+
+    def _initialize(self, squeeze: bool, kwargs: dict[str, int]):
+        # names are interned (generated names like 'dim_0' are not by
+        # default), so that lookups by name mostly compare by identity
+        self._all_names = tuple(map(sys.intern, kwargs.keys()))
+        self._all_sizes = tuple(kwargs.values())
         self._squeeze = squeeze
-        self._all_names = tuple(self._levels.keys())
 
         # filter active dimensions
-        self._dimensions = {
-            name: size for name, size in kwargs.items() if not (squeeze and size <= 1)
-        }
-        self._shape = tuple(self._dimensions.values())
-        self._names = tuple(self._dimensions.keys())
+        active = [
+            (name, size)
+            for name, size in zip(self._all_names, self._all_sizes)
+            if not (squeeze and size <= 1)
+        ]
+        self._names = tuple(name for name, _ in active)
+        self._shape = tuple(size for _, size in active)
+
+        # positions of the active dimensions by name
+        self._index = {name: i for i, name in enumerate(self._names)}
+
+        # index keys by normalized keys (see `get_index`)
+        self._index_cache: dict[tuple[tuple[str, Any], ...], IndexKey] = {}
 
     def __getitem__(self, key):
-        return self._dimensions[key]
+        return self._shape[self._index[key]]
+
+    def __contains__(self, key):
+        return key in self._index
 
     def __iter__(self):
-        return iter(self._dimensions)
+        return iter(self._names)
 
     def __len__(self):
-        return len(self._dimensions)
+        return len(self._names)
 
     def __repr__(self) -> str:
-        return ', '.join(f'{name}={size}' for name, size in self._dimensions.items())
+        return ', '.join(
+            f'{name}={size}' for name, size in zip(self._names, self._shape)
+        )
 
     def __eq__(self, other):
-        return self._dimensions == other._dimensions
+        if not isinstance(other, Dimensions):
+            return NotImplemented
+        return (
+            self._squeeze == other._squeeze
+            and self._all_names == other._all_names
+            and self._all_sizes == other._all_sizes
+        )
+
+    def __hash__(self):
+        return hash((self._squeeze, self._all_names, self._all_sizes))
 
     @property
     def shape(self):
@@ -42,35 +110,87 @@ class Dimensions(Mapping[str, int]):
         return self._squeeze
 
     def with_dimensions(self, **kwargs: int):
+        if not kwargs:
+            # instances are immutable
+            return self
         if set(self.names) & set(kwargs.keys()):
             raise ValueError("Cannot override existing dimension")
-        return Dimensions(squeeze=self._squeeze, **self._levels, **kwargs)
+        return Dimensions(
+            squeeze=self._squeeze,
+            **dict(zip(self._all_names, self._all_sizes)),
+            **kwargs,
+        )
 
     def get_index(self, **keys: slice | int):
-        return IndexKey(self, **keys)
+        # xarray/dask request many chunks with identical keys; slices are not
+        # hashable (before python 3.12), hence keys are normalized to tuples
+        cache_key = tuple(
+            (name, (k.start, k.stop, k.step) if isinstance(k, slice) else k)
+            for name, k in sorted(keys.items())
+        )
+        index = self._index_cache.get(cache_key)
+        if index is None:
+            # the cache is kept per instance (and bounded), so that it does not
+            # keep otherwise unused dimensions alive
+            if len(self._index_cache) >= _INDEX_CACHE_SIZE:
+                self._index_cache.clear()
+            index = self._index_cache[cache_key] = IndexKey(self, **keys)
+        return index
+
+
+def _make_dimensions(
+    cls: type[Dimensions], squeeze: bool, levels: tuple[tuple[str, int], ...]
+) -> Dimensions:
+    return cls(squeeze, **dict(levels))
+
+
+def _slice_to_range(key: slice, size: int) -> range:
+    # same as `range(*key.indices(size))`, with a fast path for unit steps
+    # (the only ones xarray passes for basic indexing)
+    if key.step is not None and key.step != 1:
+        return range(*key.indices(size))
+    start, stop = key.start, key.stop
+    if start is None:
+        start = 0
+    elif start < 0:
+        start = max(start + size, 0)
+    else:
+        start = min(start, size)
+    if stop is None:
+        stop = size
+    elif stop < 0:
+        stop = max(stop + size, 0)
+    else:
+        stop = min(stop, size)
+    return range(start, stop)
 
 
 class IndexKey:
+    # index keys are cached per dimensions and keys and queried for every
+    # chunk, hence shape and source ranges are resolved once on creation
+    __slots__ = ('_dimensions', '_keys', '_shape', '_ranges')
+
     def __init__(self, dims: Dimensions, **keys: slice | int):
         self._dimensions = dims
-        self._names = dims._all_names
         if not keys:
-            self._shape = tuple(dims._levels.values())
-            self._keys = tuple(slice(N) for N in self._shape)
+            self._keys = tuple(slice(N) for N in dims._all_sizes)
         else:
             if len(keys) != len(dims):
                 raise ValueError('Number of keys must match the number of dimensions')
 
             _keys: List[slice[int, int, int]] = []
-            _shape: List[int] = []
-            for name, size in dims._levels.items():
-                key = keys.get(name, slice(dims._levels[name]))
+            for name, size in zip(dims._all_names, dims._all_sizes):
+                key = keys.get(name, slice(size))
                 if isinstance(key, int):
                     key = slice(key, key + 1, 1)
                 _keys.append(key)
-                _shape.append(len(range(*key.indices(size))))
             self._keys = tuple(_keys)
-            self._shape = tuple(_shape)
+
+        self._ranges = {
+            name: _slice_to_range(key, size)
+            for name, size, key in zip(dims._all_names, dims._all_sizes, self._keys)
+        }
+        self._shape = tuple(map(len, self._ranges.values()))
 
     @property
     def shape(self) -> tuple[int, ...]:
@@ -81,11 +201,7 @@ class IndexKey:
         return self._keys
 
     def get_source_range(self, name: str, default=range(1)) -> range:
-        if name not in self._names:
-            return default
-        else:
-            index = self._names.index(name)
-            return range(*self._keys[index].indices(self._dimensions._levels[name]))
+        return self._ranges.get(name, default)
 
     def get_top_level_indices(self, depth: int):
         pass
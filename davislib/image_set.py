@@ -1,6 +1,8 @@
 # %%
+import os
+import threading
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List, Optional
 
 import lvpyio as lv
 import numpy as np
@@ -14,10 +16,48 @@ from .dimensions import Dimensions
 from .scale import Scale
 
 
+# %%
+_BUFFER_FILE_SUFFIXES = ('.im7', '.imx', '.vc7', '.ivc')
+
+# bytes of decoded planes kept between reads (see `_read_frame_planes`)
+_PLANE_CACHE_BYTES = 64 * 2**20
+
+# number of buffers with attribute snapshots kept between reads
+_ATTRIBUTE_CACHE_SIZE = 256
+
+
+def _buffer_files(filename: str | Path) -> List[Path]:
+    # DaVis stores every buffer of a set in a separate file next to the
+    # (optional) '.set' file, named in buffer order
+    path = Path(filename)
+    if path.suffix.lower() == '.set':
+        path = path.with_suffix('')
+    if not path.is_dir():
+        return []
+    return sorted(
+        p for p in path.iterdir() if p.suffix.lower() in _BUFFER_FILE_SUFFIXES
+    )
+
+
+def _will_need(path: Path):
+    # ask the kernel to read the file ahead (the hint is best effort)
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
 # %%
 class ImageSetAccessor:
     def __init__(
-        self, filename_or_obj: str | Path | lv.io.set.Set, squeeze: bool = True
+        self,
+        filename_or_obj: str | Path | lv.io.set.Set,
+        squeeze: bool = True,
+        sequential_hint: bool = False,
     ):
         if isinstance(filename_or_obj, lv.io.set.Set):
             image_set = filename_or_obj
@@ -35,6 +75,8 @@ class ImageSetAccessor:
         first_frame: Frame = first_buffer[0]
 
         self._image_set: lv.io.set.Set = image_set
+        self._lock = threading.Lock()
+        self._cache_lock = threading.Lock()
         self._title: str = getattr(image_set, 'title', '')
 
         self._dimensions = Dimensions(
@@ -44,10 +86,145 @@ class ImageSetAccessor:
         )
 
         self._components = self._initialize_components(first_frame)
-        self._attributes = self.list_attributes(0, 0, infer_types=True)
+
+        # attribute types are inferred on first access
+        self._attributes: Optional[Dict[str, Attribute]] = None
+        self._attribute_definitions: Dict[str, Attribute] = {}
+
+        # planes of recently read frames by buffer, frame and component, so
+        # that reading several chunks of the same frames decodes their buffer
+        # only once; bounded by bytes, as frames of a set may be large
+        self._plane_cache: Dict[tuple[int, int, str], List[np.ndarray]] = {}
+        self._plane_cache_nbytes = 0
+
+        # snapshots of the attributes of recently read buffers, so that
+        # reading attributes does not load the whole buffer again
+        self._attribute_cache: Dict[
+            int, tuple[Dict[str, Any], tuple[Dict[str, Any], ...]]
+        ] = {}
+
+        # number of registered readers (see `open_reader`), the set is only
+        # closed once all of them are done
+        self._readers = 0
+        self._closed = False
+        self._readers_done = threading.Condition()
+
+        # files of the buffers, if buffers are read in order the file of the
+        # next buffer is prefetched while the current one is processed
+        self._prefetch_files: List[Path] = []
+        if (
+            sequential_hint
+            and hasattr(os, 'posix_fadvise')
+            and not isinstance(filename_or_obj, lv.io.set.Set)
+        ):
+            files = _buffer_files(filename_or_obj)
+            if len(files) == len(image_set):  # type: ignore
+                self._prefetch_files = files
+
+    def open_reader(self) -> bool:
+        # registers a reader, so that the set is not closed by another thread
+        # while it is read; returns False if the set is closed already
+        with self._readers_done:
+            if self._closed:
+                return False
+            self._readers += 1
+            return True
+
+    def close_reader(self):
+        with self._readers_done:
+            self._readers -= 1
+            self._readers_done.notify_all()
 
     def close(self):
-        self._image_set.close()
+        # waits for registered readers
+        with self._readers_done:
+            self._closed = True
+            self._readers_done.wait_for(lambda: self._readers == 0)
+        with self._cache_lock:
+            self._plane_cache.clear()
+            self._plane_cache_nbytes = 0
+            self._attribute_cache.clear()
+        with self._lock:
+            self._image_set.close()
+
+    def _read_buffer(self, ibuffer: int) -> Buffer:
+        # lvpyio does not document thread safety of sets, hence reads are
+        # serialized here while copying and scaling run concurrently
+        with self._lock:
+            buffer = self._image_set[ibuffer]  # type: ignore
+        if ibuffer + 1 < len(self._prefetch_files):
+            _will_need(self._prefetch_files[ibuffer + 1])
+        return buffer
+
+    def _read_frame_planes(
+        self, ibuffer: int, iframes: range, name: str
+    ) -> List[List[np.ndarray]]:
+        # planes of a component for several frames of a buffer, the buffer is
+        # only read if any of the frames is not cached
+        keys = [(ibuffer, iframe, name) for iframe in iframes]
+        with self._cache_lock:
+            frames = [self._plane_cache.pop(key, None) for key in keys]
+            for key, planes in zip(keys, frames):
+                if planes is not None:
+                    # reinserted as most recently used
+                    self._plane_cache[key] = planes
+
+        if any(planes is None for planes in frames):
+            buffer = self._read_buffer(ibuffer)
+            self._snapshot_attributes(ibuffer, buffer)
+            frames = [
+                buffer[iframe].components[name].planes if planes is None else planes
+                for iframe, planes in zip(iframes, frames)
+            ]
+            with self._cache_lock:
+                for key, planes in zip(keys, frames):
+                    self._cache_planes(key, planes)
+
+        return frames
+
+    def _cache_planes(self, key: tuple[int, int, str], planes: List[np.ndarray]):
+        # must be called while holding the cache lock
+        nbytes = sum(plane.nbytes for plane in planes)
+        if key in self._plane_cache or nbytes > _PLANE_CACHE_BYTES:
+            return
+        self._plane_cache[key] = planes
+        self._plane_cache_nbytes += nbytes
+        while self._plane_cache_nbytes > _PLANE_CACHE_BYTES:
+            # evict least recently used planes first
+            oldest = self._plane_cache.pop(next(iter(self._plane_cache)))
+            self._plane_cache_nbytes -= sum(plane.nbytes for plane in oldest)
+
+    def _snapshot_attributes(
+        self, ibuffer: int, buffer: Buffer
+    ) -> tuple[Dict[str, Any], tuple[Dict[str, Any], ...]]:
+        with self._cache_lock:
+            snapshot = self._attribute_cache.get(ibuffer)
+        if snapshot is None:
+            snapshot = dict(buffer.attributes), tuple(
+                dict(buffer[iframe].attributes) for iframe in range(len(buffer))
+            )
+            with self._cache_lock:
+                self._attribute_cache[ibuffer] = snapshot
+                if len(self._attribute_cache) > _ATTRIBUTE_CACHE_SIZE:
+                    del self._attribute_cache[next(iter(self._attribute_cache))]
+        return snapshot
+
+    def _read_attributes(
+        self, ibuffer: int
+    ) -> tuple[Dict[str, Any], tuple[Dict[str, Any], ...]]:
+        # the buffer is read without caching its planes, so that scanning
+        # attributes does not evict pixel data
+        with self._cache_lock:
+            snapshot = self._attribute_cache.get(ibuffer)
+        if snapshot is None:
+            snapshot = self._snapshot_attributes(ibuffer, self._read_buffer(ibuffer))
+        return snapshot
+
+    def _buffer_attrs(self, ibuffer: int) -> Dict[str, Any]:
+        return self._read_attributes(ibuffer)[0]
+
+    def _frame_attrs(self, ibuffer: int, iframe: int) -> Dict[str, Any]:
+        return self._read_attributes(ibuffer)[1][iframe]
 
     def _initialize_shape(self, buffer: Buffer, frame: Frame) -> tuple[int, ...]:
         # shape of dataset
@@ -85,66 +262,95 @@ class ImageSetAccessor:
 
     @property
     def attributes(self):
+        if self._attributes is None:
+            self._attributes = self.list_attributes(0, 0, infer_types=True)
         return self._attributes
 
-    def _infer_attribute_types(self, raw_attributes: Dict[str, Attribute]):
-        # setup
-        result: Dict[str, Attribute] = {}
-        attrs = raw_attributes.copy()
-        original = attrs.copy()
-
-        # device data attributes
-        if 'DevDataSources' in attrs:
-            s = attrs.pop('DevDataSources').value
+    def get_attribute_definition(self, key: str) -> Attribute:
+        # infers the type of a single attribute without inferring all others
+        if self._attributes is not None:
+            return self._attributes[key]
+        if key not in self._attribute_definitions:
+            raw_attributes = self.list_attributes(0, 0, infer_types=False)
+            units = self._attribute_units(raw_attributes)
+            if key not in self._attribute_keys(raw_attributes, units):
+                raise KeyError(key)
+            self._attribute_definitions[key] = self._infer_attribute(
+                key, raw_attributes, units
+            )
+        return self._attribute_definitions[key]
+
+    @staticmethod
+    def _attribute_units(raw_attributes: Dict[str, Attribute]) -> Dict[str, str]:
+        # units stored as separate '<key>.Unit' attributes, built in one pass
+        return {
+            key[:-5]: attr.value
+            for key, attr in raw_attributes.items()
+            if key.endswith('.Unit') and key[:-5] in raw_attributes
+        }
+
+    @staticmethod
+    def _attribute_keys(
+        raw_attributes: Dict[str, Attribute], units: Dict[str, str]
+    ) -> List[str]:
+        # device data traces (all other device data attributes describe them)
+        keys = []
+        if 'DevDataSources' in raw_attributes:
+            s = raw_attributes['DevDataSources'].value
             N = int(s) if s is not None else 0
-            for k in range(N):
-                attr = attrs.pop(f'DevDataTrace{k}')
-                _ = attrs.pop(f'DevDataClass{k}')
-                _ = attrs.pop(f'DevDataChannel{k}')
-                name = attrs.pop(f'DevDataName{k}').value
-                alias = attrs.pop(f'DevDataAlias{k}').value
-                _ = attrs.pop(f'DevDataScaleX{k}').value
-
-                i_scale = Scale.from_str(
-                    attrs.pop(f'DevDataScaleI{k}').value  # type: ignore
-                )  # type: ignore
-
-                result[attr.key] = Attribute.infer(
-                    attr.key,
-                    attr.level,
-                    self.dimensions,
-                    attr.value,
-                    scale=i_scale,
-                    extra=dict(name=name, alias=alias),
-                )
-
-        # remaining attributes
-        while attrs:
-            key, value = attrs.popitem()
+            keys.extend(f'DevDataTrace{k}' for k in range(N))
+
+        # remaining attributes, units are merged into their attributes
+        for key in raw_attributes:
             if key.startswith('DevData'):
                 continue
-            if key.endswith('.Unit') and key[:-5] in original:
+            if key.endswith('.Unit') and key[:-5] in units:
                 continue
+            keys.append(key)
+
+        return keys
 
-            unit = None
-            if f'{key}.Unit' in original:
-                a = original.get(f'{key}.Unit')
-                if isinstance(a, Attribute):
-                    unit = a.value
-            result[key] = Attribute.infer(
-                key, value.level, self.dimensions, value.value, unit=unit
+    def _infer_attribute(
+        self, key: str, raw_attributes: Dict[str, Attribute], units: Dict[str, str]
+    ):
+        attr = raw_attributes[key]
+
+        if key.startswith('DevDataTrace'):
+            k = key[len('DevDataTrace') :]
+            i_scale = Scale.from_str(
+                raw_attributes[f'DevDataScaleI{k}'].value  # type: ignore
             )
+            return Attribute.infer(
+                key,
+                attr.level,
+                self.dimensions,
+                attr.value,
+                scale=i_scale,
+                extra=dict(
+                    name=raw_attributes[f'DevDataName{k}'].value,
+                    alias=raw_attributes[f'DevDataAlias{k}'].value,
+                ),
+            )
+
+        return Attribute.infer(
+            key, attr.level, self.dimensions, attr.value, unit=units.get(key)
+        )
 
-        return result
+    def _infer_attribute_types(self, raw_attributes: Dict[str, Attribute]):
+        units = self._attribute_units(raw_attributes)
+        return {
+            key: self._infer_attribute(key, raw_attributes, units)
+            for key in self._attribute_keys(raw_attributes, units)
+        }
 
     def list_attributes(self, buffer=0, frame=0, infer_types: bool = True):
         attrs: Dict[str, Attribute] = {}
 
-        for key, value in self._image_set[buffer].attributes.items():
+        for key, value in self._buffer_attrs(buffer).items():
             attrs[key] = Attribute(
                 key, AttributeLevel.BUFFER, self.dimensions, raw_value=value
             )
-        for key, value in self._image_set[buffer][frame].attributes.items():
+        for key, value in self._frame_attrs(buffer, frame).items():
             attrs[key] = Attribute(
                 key, AttributeLevel.FRAME, self.dimensions, raw_value=value
             )
@@ -163,41 +369,74 @@ class ImageSetAccessor:
             component = self._components[component]
 
         index = component.dimensions.get_index(**keys)
-        data = np.empty(index.shape, dtype=component.dtype)
-
-        iy, ix = index.keys[-2:]
-        for i, ibuffer in enumerate(index.get_source_range('buffer')):
-            buffer = self._image_set[ibuffer]
-            for j, iframe in enumerate(index.get_source_range('frame')):
-                frame = buffer[iframe]
-                for k, iz in enumerate(index.get_source_range('z')):
-                    frame.components[component.name][iz]
-                    data[i, j, k, ...] = frame.components[component.name][0][iy, ix]
-
-        # squeeze out extra dimensions
         if component.dimensions._squeeze:
-            data = data.squeeze()
+            # allocate the squeezed array directly and fill it through a
+            # (contiguous) view with all dimensions of the index
+            data = np.empty(
+                tuple(n for n in index.shape if n != 1), dtype=component.dtype
+            )
+        else:
+            data = np.empty(index.shape, dtype=component.dtype)
+        view = data.reshape(index.shape)
+
+        # source ranges are resolved once; all planes of a frame are copied
+        # in a single call, so only buffers and frames are iterated here
+        iframes = index.get_source_range('frame')
+        iz = index.get_source_range('z')
+        # `iy` and `ix` are always basic slices (integer keys are converted
+        # by the index), so planes are read through views without fancy
+        # indexing; `data` is C-ordered with buffer and frame as the outer
+        # axes, hence every frame is written to one contiguous block
+        iy, ix = index.keys[-2:]
+        if iz:
+            for i, ibuffer in enumerate(index.get_source_range('buffer')):
+                frames = self._read_frame_planes(ibuffer, iframes, component.name)
+                for j, planes in enumerate(frames):
+                    # copy all requested planes of the frame in a single call
+                    # and scale them in place while they are still cached
+                    # (data is already allocated with the scaled dtype)
+                    component.read_planes(planes, iz, iy, ix, out=view[i, j])
 
-        return component.scale_data(data)
+        return data
 
     def get_attribute(self, attribute: str | Attribute, **keys: slice | int):
         if isinstance(attribute, str):
-            attribute = self._attributes[attribute]
+            attribute = self.get_attribute_definition(attribute)
 
         index = attribute.dimensions.get_index(**keys)
-        data = np.empty(index.shape, dtype=attribute.dtype)
-
-        for i, ibuffer in enumerate(index.get_source_range('buffer')):
-            buffer = self._image_set[ibuffer]
-            for j, iframe in enumerate(index.get_source_range('frame')):
-                if attribute.level == AttributeLevel.BUFFER:
-                    value = buffer.attributes[attribute.key]
-                else:
-                    value = buffer[iframe].attributes[attribute.key]
-                if len(index.keys) <= 2:
-                    data[i, j, ...] = attribute.decode(value)
-                else:
-                    data[i, j, ...] = attribute.decode(value)[index.keys[2:]]
+
+        # collect the raw values of all buffers and frames first, so that
+        # they are decoded in a single call
+        ibuffers = index.get_source_range('buffer')
+        iframes = index.get_source_range('frame')
+        if attribute.level == AttributeLevel.BUFFER:
+            # constant across frames, hence decoded once per buffer and
+            # broadcast to all frames
+            values = [
+                self._buffer_attrs(ibuffer)[attribute.key] for ibuffer in ibuffers
+            ]
+            decoded = attribute.decode_batch(values).reshape(
+                len(ibuffers), 1, *attribute.shape
+            )
+        else:
+            values = [
+                self._frame_attrs(ibuffer, iframe)[attribute.key]
+                for ibuffer in ibuffers
+                for iframe in iframes
+            ]
+            decoded = attribute.decode_batch(values).reshape(
+                len(ibuffers), len(iframes), *attribute.shape
+            )
+        if len(index.keys) > 2:
+            decoded = decoded[(slice(None), slice(None)) + index.keys[2:]]
+
+        # the decoded array is returned as is, unless it has to be broadcast
+        # across frames or cast to the attribute type
+        if decoded.shape == index.shape and decoded.dtype == attribute.dtype:
+            data = decoded
+        else:
+            data = np.empty(index.shape, dtype=attribute.dtype)
+            data[...] = decoded
 
         # squeeze out extra dimensions
         if attribute.dimensions._squeeze:
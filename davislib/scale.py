@@ -1,12 +1,65 @@
 # %%
 from __future__ import annotations
 
+import functools
+import math
+
 import lvpyio as lv
 import numpy as np
 
 
+# %%
+@functools.lru_cache(maxsize=256)
+def _int_dtype(signed: bool, bit_length: int) -> np.dtype:
+    for size in (8, 16, 32, 64):
+        if signed and bit_length < size:
+            return np.dtype(f'int{size}')
+        if not signed and bit_length <= size:
+            return np.dtype(f'uint{size}')
+    return np.dtype(object)
+
+
+def _min_int_dtype(value: int) -> np.dtype:
+    # same result as `np.min_scalar_type` for python integers, but without
+    # a round trip through numpy for every value
+    if value >= 0:
+        return _int_dtype(False, value.bit_length())
+    else:
+        return _int_dtype(True, (~value).bit_length())
+
+
+def _min_scalar_dtype(value: int | float) -> np.dtype:
+    if isinstance(value, int):
+        return _min_int_dtype(value)
+    else:
+        return np.min_scalar_type(value)
+
+
+def _as_int_if_close(value: int | float) -> int | float:
+    # same tolerance as `np.allclose(value, np.array(value, dtype=int))`
+    if isinstance(value, int) or not math.isfinite(value):
+        return value
+    truncated = int(value)
+    if abs(value - truncated) <= 1e-8 + 1e-5 * abs(truncated):
+        return truncated
+    return value
+
+
 # %%
 class Scale:
+    # scales built from DaVis metadata are shared by all attributes and
+    # components with the same scaling (see `_shared`), hence they are
+    # immutable
+    __slots__ = (
+        'dtype',
+        'slope',
+        'offset',
+        '_slope_scalar',
+        '_offset_scalar',
+        'unit',
+        'description',
+    )
+
     def __init__(
         self,
         slope: int | float | np.ndarray = 1,
@@ -14,20 +67,57 @@ class Scale:
         unit: str = '',
         description: str = '',
     ):
-        # check if we can represent the slope and offset as integers
-        if np.allclose(slope, np.array(slope, dtype=int)):
-            slope = np.array(slope, dtype=int)
-        if np.allclose(offset, np.array(offset, dtype=int)):
-            offset = np.array(offset, dtype=int)
+        if isinstance(slope, (int, float)) and isinstance(offset, (int, float)):
+            # python scalars (the common case for DaVis scales) are handled
+            # without numpy round trips
+            slope = _as_int_if_close(slope)
+            offset = _as_int_if_close(offset)
+            dtype = np.promote_types(
+                _min_scalar_dtype(slope), _min_scalar_dtype(offset)
+            )
+        else:
+            # check if we can represent the slope and offset as integers
+            if np.allclose(slope, np.array(slope, dtype=int)):
+                slope = np.array(slope, dtype=int)
+            if np.allclose(offset, np.array(offset, dtype=int)):
+                offset = np.array(offset, dtype=int)
 
-        # determine the smallest dtype that can represent both slope and offset
-        self.dtype = self._min_dtype(slope, offset)
+            # determine the smallest dtype that can represent both slope and offset
+            dtype = self._min_dtype(slope, offset)
 
         # convert slope and offset to the determined dtype
-        self.slope = np.array(slope, dtype=self.dtype)
-        self.offset = np.array(offset, dtype=self.dtype)
-        self.unit = unit
-        self.description = description
+        slope = np.array(slope, dtype=dtype)
+        offset = np.array(offset, dtype=dtype)
+        slope.setflags(write=False)
+        offset.setflags(write=False)
+
+        self._assign(
+            dtype=dtype,
+            slope=slope,
+            offset=offset,
+            # python scalars for the array path of `scale_data` (cheaper to
+            # dispatch than 0-d arrays)
+            _slope_scalar=slope.item() if slope.ndim == 0 else slope,
+            _offset_scalar=offset.item() if offset.ndim == 0 else offset,
+            unit=unit,
+            description=description,
+        )
+
+    def _assign(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        self._assign(**state)
 
     def _min_dtype(self, slope, offset):
         slope_dtype = np.min_scalar_type(slope)
@@ -40,14 +130,43 @@ class Scale:
     def label(self):
         return f'{self.description} [{self.unit}]'
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _shared(slope: float, offset: float, unit: str, description: str) -> Scale:
+        # all frames of a set usually share their scales, hence scales built
+        # from DaVis metadata are shared instead of rebuilt for every frame
+        return Scale(slope, offset, unit, description)
+
     @staticmethod
     def from_str(value: str) -> Scale:
         slope, offset, unit, description = value.split('\n')
-        return Scale(float(slope), float(offset), unit, description)
+        return Scale._shared(float(slope), float(offset), unit, description)
 
     @staticmethod
     def from_davis_scale(scale: lv.Scale) -> Scale:
-        return Scale(scale.slope, scale.offset, scale.unit, scale.description)
+        return Scale._shared(scale.slope, scale.offset, scale.unit, scale.description)
+
+    @property
+    def is_identity(self) -> bool:
+        return bool(np.all(self.slope == 1) and np.all(self.offset == 0))
+
+    def scale_data(self, data: np.ndarray, out: np.ndarray | None = None):
+        if not isinstance(data, np.ndarray):
+            return self.slope * data + self.offset
+
+        if out is None:
+            dtype = np.promote_types(data.dtype, self.dtype)
+            if self.is_identity:
+                return data.astype(dtype, copy=False)
+            out = np.empty_like(data, dtype=dtype)
+        elif self.is_identity:
+            if out is not data:
+                np.copyto(out, data)
+            return out
 
-    def scale_data(self, data: np.ndarray):
-        return self.slope * data + self.offset
+        # multiply and add in a single output array to avoid a temporary; the
+        # loop runs in the dtype of the output, so that neither the data nor
+        # the (python) scalars are promoted any further
+        np.multiply(data, self._slope_scalar, out=out, dtype=out.dtype)
+        np.add(out, self._offset_scalar, out=out, dtype=out.dtype)
+        return out
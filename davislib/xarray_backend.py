@@ -1,4 +1,5 @@
 # %%
+import functools
 from pathlib import Path
 from typing import Dict, List, Mapping, Optional, Sequence
 
@@ -19,6 +20,26 @@ from .component import Component
 from .image_set import ImageSetAccessor
 
 
+# %%
+def _close_with_lock(lock, file_manager: CachingFileManager):
+    with lock:
+        file_manager.close()
+
+
+def _open_reader(lock, file_manager: CachingFileManager) -> ImageSetAccessor:
+    # the lock is only held to acquire the image set and register the reader
+    # with it, so that chunks are read (copied and scaled) concurrently, while
+    # the set is not closed until all of its readers are done
+    while True:
+        with lock:
+            images = file_manager.acquire()
+            assert isinstance(images, ImageSetAccessor)
+            if images.open_reader():
+                return images
+        # the set was closed (or evicted from the cache of the file manager)
+        # in the meantime, the file manager opens it again
+
+
 # %%
 class DavisComponentBackendArray(BackendArray):
     def __init__(
@@ -44,23 +65,23 @@ class DavisComponentBackendArray(BackendArray):
         )
 
     def _raw_indexing_method(self, key: tuple):
-        # thread safe method that access to data on disk
-        with self.lock:
-            images = self.file_manager.acquire()  # type: ignore
-            assert isinstance(images, ImageSetAccessor)
-
+        # thread safe method that access to data on disk (see `_open_reader`)
+        images = _open_reader(self.lock, self.file_manager)
+        try:
             data = images.get_data(
                 self.component.name, **dict(zip(self._key_names, key))
             )
+        finally:
+            images.close_reader()
 
-            if not self.component.dimensions.squeeze:
-                squeeze_axis = tuple(k for k, v in enumerate(key) if isinstance(v, int))
-                if squeeze_axis:
-                    data = np.squeeze(data, axis=squeeze_axis)
-            else:
-                data = np.squeeze(data)
+        if not self.component.dimensions.squeeze:
+            squeeze_axis = tuple(k for k, v in enumerate(key) if isinstance(v, int))
+            if squeeze_axis:
+                data = np.squeeze(data, axis=squeeze_axis)
+        else:
+            data = np.squeeze(data)
 
-            return data
+        return data
 
 
 class DavisAttributeBackendArray(BackendArray):
@@ -87,23 +108,23 @@ class DavisAttributeBackendArray(BackendArray):
         )
 
     def _raw_indexing_method(self, key: tuple):
-        # thread safe method that access to data on disk
-        with self.lock:
-            images = self.file_manager.acquire()  # type: ignore
-            assert isinstance(images, ImageSetAccessor)
-
+        # thread safe method that access to data on disk (see above)
+        images = _open_reader(self.lock, self.file_manager)
+        try:
             data = images.get_attribute(
-                self.attribute.key, **dict(zip(self._key_names, key))
+                self.attribute, **dict(zip(self._key_names, key))
             )
+        finally:
+            images.close_reader()
 
-            if not self.attribute.dimensions.squeeze:
-                squeeze_axis = tuple(k for k, v in enumerate(key) if isinstance(v, int))
-                if squeeze_axis:
-                    data = np.squeeze(data, axis=squeeze_axis)
-            else:
-                data = np.squeeze(data)
+        if not self.attribute.dimensions.squeeze:
+            squeeze_axis = tuple(k for k, v in enumerate(key) if isinstance(v, int))
+            if squeeze_axis:
+                data = np.squeeze(data, axis=squeeze_axis)
+        else:
+            data = np.squeeze(data)
 
-            return data
+        return data
 
 
 class DavisBackend(BackendEntrypoint):
@@ -118,12 +139,14 @@ class DavisBackend(BackendEntrypoint):
             None | Sequence[Attribute | str] | Mapping[str, Attribute | str]
         ) = None,
         squeeze: bool = False,
+        sequential_hint: bool = False,
     ):
-        # file manager
+        # file manager (with `sequential_hint`, the next buffer is prefetched
+        # on every read, which only pays off if buffers are read in order)
         self.file_manager = CachingFileManager(
             ImageSetAccessor,
             filename_or_obj,
-            kwargs=dict(squeeze=squeeze),
+            kwargs=dict(squeeze=squeeze, sequential_hint=sequential_hint),
         )
 
         # open image set
@@ -135,7 +158,7 @@ class DavisBackend(BackendEntrypoint):
 
         def get_default(name_or_instance: str | Attribute) -> Attribute:
             if isinstance(name_or_instance, str):
-                return images.attributes[name_or_instance]
+                return images.get_attribute_definition(name_or_instance)
             else:
                 return name_or_instance
 
@@ -148,8 +171,11 @@ class DavisBackend(BackendEntrypoint):
         else:
             raise ValueError("attributes must be a list, tuple or dict")
 
-        # create variables
+        # create variables (all variables share the same file manager and
+        # therefore a single lock, which is only held to register readers,
+        # so variables are still read concurrently)
         variables = {}
+        lock = SerializableLock()
 
         # image components
         for name, component in images.components.items():
@@ -163,7 +189,7 @@ class DavisBackend(BackendEntrypoint):
                     DavisComponentBackendArray(
                         self.file_manager,
                         component,
-                        SerializableLock(),
+                        lock,
                     )
                 ),
                 encoding=dict(preferred_chunks=dict(buffer=1)),
@@ -184,7 +210,7 @@ class DavisBackend(BackendEntrypoint):
                     DavisAttributeBackendArray(
                         self.file_manager,
                         attr,
-                        SerializableLock(),
+                        lock,
                     )
                 ),
                 encoding=dict(preferred_chunks=dict(buffer=1)),
@@ -194,7 +220,9 @@ class DavisBackend(BackendEntrypoint):
         ds = xr.Dataset(variables)
 
         # set close method, so that xarray can close the external resource
-        ds.set_close(self.file_manager.close)
+        # (not while a variable is being read); the callable is picklable,
+        # so that datasets can be sent to other processes
+        ds.set_close(functools.partial(_close_with_lock, lock, self.file_manager))
 
         return ds
 
@@ -1,8 +1,33 @@
 from pathlib import Path
 import pytest
 
+from davislib import ImageSetAccessor
 
-@pytest.fixture(scope='function')
+
+@pytest.fixture(scope='session')
 def data_path():
     path = Path(__file__).parent / 'data'
     return path.absolute()
+
+
+@pytest.fixture(scope='session')
+def simple_set_path(data_path):
+    return data_path / 'SimpleImageSet'
+
+
+@pytest.fixture(scope='session')
+def open_image_set(data_path):
+    # accessors are opened once per set and options for the whole session
+    # and handed out to all tests that only read from them
+    accessors = {}
+
+    def _open(name: str, **kwargs) -> ImageSetAccessor:
+        key = (name, tuple(sorted(kwargs.items())))
+        if key not in accessors:
+            accessors[key] = ImageSetAccessor(data_path / name, **kwargs)
+        return accessors[key]
+
+    yield _open
+
+    for accessor in accessors.values():
+        accessor.close()
@@ -27,3 +27,49 @@ class TestAttribute:
         )
         assert attr.decode('1') == 1
         assert attr.dtype == np.dtype(int)
+
+    def test_decode_batch(self):
+        attr = Attribute(
+            'key',
+            AttributeLevel.BUFFER,
+            Dimensions(),
+            decoder=int,
+            dtype=np.dtype(int),
+        )
+        values = attr.decode_batch(['1', '2', '3'])
+        assert values.dtype == np.dtype(int)
+        np.testing.assert_array_equal(values, [1, 2, 3])
+
+    def test_decode_timestamp_batch(self):
+        values = [
+            '2025-02-12T11:55:25,594+01:00',
+            '2025-02-05T14:04:59,8+01:00',
+            '2025-02-05T14:05:00+01:00',
+            '2025-02-05T14:05:00.123456-05:00',
+        ]
+        attr = Attribute.infer(
+            'Timestamp', AttributeLevel.BUFFER, Dimensions(), values[0]
+        )
+        expected = np.array(
+            [attr.decode(value) for value in values], dtype='datetime64[us]'
+        )
+        np.testing.assert_array_equal(attr.decode_batch(values), expected, strict=True)
+
+    def test_decode_batch_of_inferred_numbers(self):
+        ints = Attribute.infer('key', AttributeLevel.BUFFER, Dimensions(), '2560')
+        values = ints.decode_batch(['2560', '250'])
+        assert values.dtype == np.uint16
+        np.testing.assert_array_equal(values, [2560, 250])
+
+        floats = Attribute.infer('key', AttributeLevel.BUFFER, Dimensions(), '0.5')
+        values = floats.decode_batch(['0.5', '1e3', 'nan'])
+        assert values.dtype == np.float64
+        np.testing.assert_array_equal(values, [0.5, 1000.0, np.nan])
+
+    def test_decode_batch_of_wide_integers(self):
+        wide = '99999999999999999999999'
+        attr = Attribute.infer('key', AttributeLevel.BUFFER, Dimensions(), wide)
+        values = attr.decode_batch([wide, '1'])
+        assert values.dtype == np.dtype(object)
+        assert values.tolist() == [int(wide), 1]
+        assert type(values[0]) is int
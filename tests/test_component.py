@@ -0,0 +1,27 @@
+import pickle
+
+import numpy as np
+import numpy.testing
+
+from davislib import Dimensions, Scale
+from davislib.component import Component
+
+
+class TestComponent:
+    def test_read_scaled_planes(self):
+        component = Component(
+            'PIXEL',
+            Dimensions(z=1, y=2, x=3),
+            np.dtype(np.uint16),
+            Scale(2.5, 1.0),
+        )
+        planes = [np.arange(6, dtype=np.uint16).reshape(2, 3)]
+        out = np.empty((1, 2, 3), dtype=component.dtype)
+
+        component.read_planes(planes, range(1), slice(None), slice(None), out=out)
+        numpy.testing.assert_array_equal(out[0], 2.5 * planes[0] + 1.0)
+
+        # components stay picklable after the reader has been specialized
+        restored = pickle.loads(pickle.dumps(component))
+        restored.read_planes(planes, range(1), slice(None), slice(None), out=out)
+        numpy.testing.assert_array_equal(out[0], 2.5 * planes[0] + 1.0)
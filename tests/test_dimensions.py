@@ -1,6 +1,10 @@
+import gc
+import pickle
+import weakref
+
 import pytest
 
-from davislib.dimensions import Dimensions, IndexKey
+from davislib.dimensions import Dimensions, IndexKey, _slice_to_range
 
 
 class TestDimensions:
@@ -37,6 +41,14 @@ class TestDimensions:
         assert dims.shape == ()
         assert dims.names == ()
 
+    def test_dimensions_mapping(self):
+        dims = Dimensions(width=10, depth=1, height=20)
+        assert dict(dims) == {'width': 10, 'height': 20}
+        assert len(dims) == 2
+        with pytest.raises(KeyError):
+            dims['depth']
+        assert not hasattr(dims, '__dict__')
+
     def test_with_dimensions_add(self):
         dims = Dimensions(width=10, height=20)
         new_dims = dims.with_dimensions(depth=5)
@@ -54,6 +66,7 @@ class TestDimensions:
         new_dims = dims.with_dimensions()
         assert new_dims.shape == (10, 20)
         assert new_dims.names == ('width', 'height')
+        assert new_dims is dims
 
     def test_with_dimensions_squeeze_false(self):
         dims = Dimensions(squeeze=False, width=10, height=20)
@@ -67,6 +80,34 @@ class TestDimensions:
         assert new_dims.shape == (10, 20)
         assert new_dims.names == ('width', 'height')
 
+    def test_instances_are_shared(self):
+        dims = Dimensions(width=10, height=20)
+        assert Dimensions(width=10, height=20) is dims
+        assert Dimensions(height=20, width=10) is not dims
+        assert Dimensions(squeeze=False, width=10, height=20) is not dims
+        assert pickle.loads(pickle.dumps(dims)) is dims
+
+    def test_equality_and_hash(self):
+        dims = Dimensions(width=10, height=20)
+        assert dims == Dimensions(width=10, height=20)
+        assert hash(dims) == hash(Dimensions(width=10, height=20))
+        assert dims != Dimensions(height=20, width=10)
+        assert dims != Dimensions(squeeze=False, width=10, height=20)
+
+    def test_get_index_is_cached(self):
+        dims = Dimensions(nbuffer=10, ny=250, nx=2560)
+        key = dims.get_index(nbuffer=slice(0, 5), ny=slice(None), nx=3)
+        assert dims.get_index(nx=3, ny=slice(None), nbuffer=slice(0, 5)) is key
+        assert key.shape == (5, 250, 1)
+
+    def test_index_cache_does_not_keep_dimensions_alive(self):
+        dims = Dimensions(nbuffer=10, index_cache_test=250)
+        dims.get_index(nbuffer=slice(0, 5), index_cache_test=3)
+        ref = weakref.ref(dims)
+        del dims
+        gc.collect()
+        assert ref() is None
+
 
 class TestIndexKey:
     def test_empty_keys(self):
@@ -107,3 +148,11 @@ class TestIndexKey:
         assert key.get_source_range('non_existing', default=range(0, 10)) == range(
             0, 10
         )
+
+
+@pytest.mark.parametrize('start', [None, -12, -3, 2, 12])
+@pytest.mark.parametrize('stop', [None, -12, -3, 2, 12])
+@pytest.mark.parametrize('step', [None, 1, -1])
+def test_slice_to_range(start, stop, step):
+    key = slice(start, stop, step)
+    assert _slice_to_range(key, 10) == range(*key.indices(10))
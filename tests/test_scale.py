@@ -0,0 +1,90 @@
+import pickle
+
+import numpy as np
+import numpy.testing
+import pytest
+
+from davislib import Scale
+from davislib.scale import _min_int_dtype
+
+
+class TestScale:
+    def test_identity_scaling(self):
+        scale = Scale(1, 0, 'counts')
+        data = np.arange(6, dtype=np.uint16).reshape(2, 3)
+
+        scaled = scale.scale_data(data)
+        assert scale.is_identity
+        assert scaled.dtype == np.uint16
+        numpy.testing.assert_array_equal(scaled, data)
+
+    def test_linear_scaling(self):
+        scale = Scale(0.5, 10, 'mm')
+        data = np.arange(6, dtype=np.uint16).reshape(2, 3)
+
+        scaled = scale.scale_data(data)
+        assert not scale.is_identity
+        assert scaled.dtype == np.promote_types(np.uint16, scale.dtype)
+        numpy.testing.assert_allclose(scaled, 0.5 * data + 10)
+
+    def test_linear_scaling_in_place(self):
+        scale = Scale(0.5, 10, 'mm')
+        data = np.arange(6, dtype=np.float32).reshape(2, 3)
+        expected = 0.5 * data + 10
+
+        scaled = scale.scale_data(data, out=data)
+        assert scaled is data
+        numpy.testing.assert_allclose(scaled, expected)
+
+    def test_shared_scales_are_immutable(self):
+        scale = Scale.from_str('0.5\n10\nmm\nlength')
+        assert Scale.from_str('0.5\n10\nmm\nlength') is scale
+
+        with pytest.raises(AttributeError):
+            scale.unit = 'm'
+        with pytest.raises(ValueError):
+            scale.slope[...] = 2
+
+        restored = pickle.loads(pickle.dumps(scale))
+        assert (restored.slope, restored.offset, restored.unit) == (0.5, 10, 'mm')
+
+    def test_integer_scaling_does_not_overflow(self):
+        scale = Scale(300, 0, 'counts')
+        data = np.arange(6, dtype=np.uint8).reshape(2, 3)
+
+        scaled = scale.scale_data(data)
+        assert scaled.dtype == np.uint16
+        numpy.testing.assert_array_equal(scaled, 300 * data.astype(int))
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        0,
+        1,
+        255,
+        256,
+        65536,
+        2**32,
+        2**64 - 1,
+        2**64,
+        -1,
+        -128,
+        -129,
+        -(2**63) - 1,
+    ],
+)
+def test_min_int_dtype(value):
+    assert _min_int_dtype(value) == np.min_scalar_type(value)
+
+
+@pytest.mark.parametrize(
+    'slope,offset',
+    [(1.0, 0.0), (1.000001, 0.0), (0.5, 10.0), (-3.0, 1000.0), (2.5e6, -0.25)],
+)
+def test_scalar_scale_matches_array_scale(slope, offset):
+    scale = Scale(slope, offset)
+    expected = Scale(np.array(slope), np.array(offset))
+    assert scale.dtype == expected.dtype
+    assert scale.slope == expected.slope
+    assert scale.offset == expected.offset
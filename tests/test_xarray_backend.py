@@ -1,11 +1,16 @@
+import pickle
+import threading
+
+import numpy as np
+import numpy.testing
 import xarray as xr
-from davislib import DavisBackend
+from davislib import DavisBackend, ImageSetAccessor
 
 
 class TestDavisImageSet:
-    def test_dimensions(self, data_path):
+    def test_dimensions(self, simple_set_path):
         images = xr.open_dataset(
-            data_path / 'SimpleImageSet',
+            simple_set_path,
             engine=DavisBackend,
         )
 
@@ -16,9 +21,9 @@ class TestDavisImageSet:
         assert len(images.y) == 250
         assert len(images.x) == 2560
 
-    def test_dimensions_with_squeeze(self, data_path):
+    def test_dimensions_with_squeeze(self, simple_set_path):
         images = xr.open_dataset(
-            data_path / 'SimpleImageSet',
+            simple_set_path,
             engine=DavisBackend,
             squeeze=True,
         )
@@ -27,3 +32,77 @@ class TestDavisImageSet:
         assert len(images.buffer) == 10
         assert len(images.y) == 250
         assert len(images.x) == 2560
+
+    def test_attributes(self, simple_set_path):
+        images = xr.open_dataset(
+            simple_set_path,
+            engine=DavisBackend,
+            attributes=['Timestamp', 'DevDataTrace0'],
+            squeeze=True,
+        )
+
+        assert images.Timestamp.dims == ('buffer',)
+        assert images.Timestamp.dtype == np.dtype('datetime64[us]')
+        assert images.DevDataTrace0.attrs['units'] == 'µs'
+        assert images.DevDataTrace0.attrs['alias'] == 'Camera 1 : Exposure time'
+
+    def test_chunked_read_matches_accessor(self, simple_set_path):
+        images = xr.open_dataset(
+            simple_set_path,
+            engine=DavisBackend,
+            chunks=dict(buffer=1),
+        )
+
+        with ImageSetAccessor(simple_set_path, squeeze=False) as accessor:
+            expected = accessor.get_data(
+                'PIXEL',
+                buffer=slice(None),
+                frame=slice(None),
+                z=slice(None),
+                y=slice(None),
+                x=slice(0, 100),
+            )
+
+        actual = images.PIXEL.isel(x=slice(0, 100)).compute(scheduler='threads')
+        numpy.testing.assert_array_equal(actual.values, expected)
+
+    def test_pickle(self, simple_set_path):
+        images = xr.open_dataset(simple_set_path, engine=DavisBackend)
+
+        restored = pickle.loads(pickle.dumps(images))
+        xr.testing.assert_identical(restored, images)
+        restored.close()
+        images.close()
+
+    def test_variables_are_read_concurrently(self, simple_set_path, monkeypatch):
+        images = xr.open_dataset(
+            simple_set_path,
+            engine=DavisBackend,
+            attributes=['Timestamp'],
+            squeeze=True,
+        )
+
+        # block a pixel read while the image set is being read
+        started, release = threading.Event(), threading.Event()
+        get_data = ImageSetAccessor.get_data
+
+        def blocking_get_data(self, *args, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return get_data(self, *args, **kwargs)
+
+        monkeypatch.setattr(ImageSetAccessor, 'get_data', blocking_get_data)
+        pixels = threading.Thread(target=lambda: images.PIXEL[0, 0].values)
+        pixels.start()
+        assert started.wait(timeout=5)
+
+        # the shared lock does not serialize the variables of the dataset
+        timestamps = threading.Thread(target=lambda: images.Timestamp.values)
+        timestamps.start()
+        timestamps.join(timeout=2)
+        finished = not timestamps.is_alive()
+
+        release.set()
+        pixels.join()
+        images.close()
+        assert finished